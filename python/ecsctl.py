@@ -7,24 +7,251 @@ Authors:
     Muhammad Ardivan (muhammad.a.s.nugroho@gdplabs.id)
 """
 
-import boto3
 import click
-from rich.console import Console
-from rich.table import Table
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import hashlib
 import json
 import os
+import pickle
+import re
+import tempfile
+import time
 from pathlib import Path
-from dotenv import load_dotenv
-import subprocess
+import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-load_dotenv()
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# orjson is optional; it is much faster than the stdlib for large responses
+try:
+    import orjson
+
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    orjson = None
+
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(data, indent=2).encode()
+        return json.dumps(data, separators=(',', ':')).encode()
+
+# boto3, botocore, rich and dotenv are imported where they are used so that
+# --help and early validation errors don't pay for loading them
 
 # Constants
 CONFIG_DIR = Path.home() / '.ecsctl'
 CONFIG_FILE = CONFIG_DIR / 'config.json'
+STS_CACHE_FILE = CONFIG_DIR / 'sts-cache.json'
+CACHE_FILE = CONFIG_DIR / 'cache.json'
+# Seconds cluster listings and membership lookups are served from cache
+CACHE_TTL = 60
+# Cached role credentials are refreshed this long before they expire
+STS_REFRESH_MARGIN = timedelta(minutes=5)
+EC2_INSTANCE_ID_PATTERN = re.compile(r'i-[0-9a-f]{8,17}')
+# ECS describe_* APIs accept at most 100 ARNs per request
+DESCRIBE_BATCH_SIZE = 100
+# Concurrent describe_* requests issued when fanning out over batches
+MAX_WORKERS = 8
+# HTTP connections kept per AWS client; must be at least MAX_WORKERS
+MAX_POOL_CONNECTIONS = 32
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive slices of at most ``size`` items from ``items``."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def _map_pipelined(
+    fn: Callable[[Any], Any], batches: Iterable[Any]
+) -> Iterator[Any]:
+    """Apply ``fn`` to each batch on a thread pool, yielding results in order.
+
+    Unlike ``Executor.map``, which drains its input before returning, each
+    batch is submitted as soon as it is produced. Describe calls for the
+    first list page therefore run while later pages are still being fetched,
+    and finished results are yielded without waiting for the input to end.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(fn, batch))
+            while pending and pending[0].done():
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+@lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load variables from a .env file once, on first use."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+def _write_atomic(path: Path, payload: bytes, fsync: bool = False) -> None:
+    """Write ``payload`` to ``path`` via a sibling temp file and rename.
+
+    The target is either left untouched or fully replaced, even if the
+    process is interrupted mid-write. The temp file is created with
+    owner-only permissions, so this is also safe for cached credentials.
+
+    Args:
+        path: File to write
+        payload: File contents
+        fsync: Flush to disk before the rename so the file also survives a
+            crash; only worth the latency for state that can't be rebuilt
+    """
+    path.parent.mkdir(exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave stray temp files behind on errors or Ctrl-C
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+def _write_json_atomic(
+    path: Path, data: Dict[str, Any], pretty: bool = False, fsync: bool = False
+) -> None:
+    """Atomically write ``data`` as JSON to ``path``.
+
+    Args:
+        path: File to write
+        data: JSON-serializable data
+        pretty: Indent the output for human-edited files; otherwise compact
+        fsync: Flush to disk before the rename, see _write_atomic
+    """
+    _write_atomic(path, _json_dumps(data, pretty=pretty), fsync=fsync)
+
+def _use_orjson_for_botocore() -> None:
+    """Have botocore decode JSON-protocol responses (ECS, SSM) with orjson.
+
+    botocore calls ``json.loads`` on every response body through the module
+    reference in botocore.parsers, so swapping that reference is enough.
+    orjson's decode error subclasses ValueError, which botocore already
+    handles. Does nothing if orjson is not installed.
+    """
+    if orjson is None:
+        return
+
+    import botocore.parsers
+
+    class _OrjsonModule:
+        """Stand-in for the json module that decodes with orjson."""
+        loads = staticmethod(orjson.loads)
+
+        def __getattr__(self, name):
+            return getattr(json, name)
+
+    botocore.parsers.json = _OrjsonModule()
+
+def _create_clients(session, service_names: List[str], client_config) -> List[Any]:
+    """Create service clients, reusing parsed botocore models across runs.
+
+    Loading the JSON service models dominates client creation, so the models
+    are pickled to CONFIG_DIR, keyed by botocore version, the first time they
+    are loaded and served from that file on later runs. The cache is skipped
+    when extra model directories (``AWS_DATA_PATH``, ``~/.aws/models``) are
+    present, since the pickle would hide changes made there.
+
+    Args:
+        session: boto3 session to create the clients from
+        service_names: Services to create clients for
+        client_config: botocore Config applied to every client
+
+    Returns:
+        Clients in the same order as ``service_names``
+    """
+    import boto3
+    import botocore
+    from botocore.exceptions import DataNotFoundError
+
+    # Wrap this session's loader only; other sessions are unaffected. boto3
+    # has no public accessor for its underlying botocore session, and the
+    # loader is only reachable through that session's get_component.
+    loader = session._session.get_component('data_loader')
+
+    bundled_paths = {
+        loader.BUILTIN_DATA_PATH,
+        os.path.join(os.path.dirname(boto3.__file__), 'data'),
+    }
+    if any(
+        os.path.isdir(path)
+        for path in loader.search_paths if path not in bundled_paths
+    ):
+        return [session.client(name, config=client_config) for name in service_names]
+
+    cache_file = CONFIG_DIR / f'models-{botocore.__version__}.pkl'
+    try:
+        with open(cache_file, 'rb') as f:
+            models = pickle.load(f)
+    except Exception:
+        models = {}
+    missed = False
+
+    load_service_model = loader.load_service_model
+
+    def cached_load_service_model(service_name, type_name, api_version=None):
+        nonlocal missed
+        key = (service_name, type_name, api_version)
+        if key not in models:
+            models[key] = load_service_model(
+                service_name, type_name, api_version=api_version
+            )
+            missed = True
+        return models[key]
+
+    loader.load_service_model = cached_load_service_model
+    clients = [session.client(name, config=client_config) for name in service_names]
+
+    # Paginator models are otherwise only loaded on the first get_paginator,
+    # after the cache has been written. Load them with the same api_version
+    # the client passes so those later lookups hit the cache.
+    for client in clients:
+        service_model = client.meta.service_model
+        try:
+            loader.load_service_model(
+                service_model.service_name, 'paginators-1', service_model.api_version
+            )
+        except DataNotFoundError:
+            pass
+
+    if missed:
+        try:
+            # Drop models pickled by other botocore versions
+            for stale_file in CONFIG_DIR.glob('models-*.pkl'):
+                if stale_file != cache_file:
+                    stale_file.unlink()
+            _write_atomic(
+                cache_file, pickle.dumps(models, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except OSError:
+            # Caching is best effort; the clients are already created
+            pass
+
+    return clients
 
 class AWSClient:
     """Interface for authenticating with Amazon Web Services (AWS).
@@ -47,6 +274,7 @@ class AWSClient:
             profile_name: AWS profile name to use for authentication. If None,
                          uses AWS_PROFILE environment variable.
         """
+        _load_env()
         self.profile_name = profile_name or os.getenv('AWS_PROFILE')
         self.region = os.getenv('AWS_REGION', 'ap-southeast-1')
 
@@ -59,34 +287,123 @@ class AWSClient:
         Returns:
             boto3.Session: Authenticated AWS session with assumed role credentials
         """
+        import boto3
+
         try:
-            # Create base session using either profile or environment credentials
-            if self.profile_name:
-                session = boto3.Session(profile_name=self.profile_name)
-            else:
-                session = boto3.Session(region_name=self.region)
-
-            # Assume role using STS
-            sts_client = session.client('sts')
-            assumed_role = sts_client.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName=session_name
-            )
+            credentials = self._load_cached_credentials(role_arn)
+            if credentials is None:
+                # Create base session using either profile or environment credentials
+                if self.profile_name:
+                    session = boto3.Session(profile_name=self.profile_name)
+                else:
+                    session = boto3.Session(region_name=self.region)
+
+                # Assume role using STS
+                sts_client = session.client('sts')
+                assumed_role = sts_client.assume_role(
+                    RoleArn=role_arn,
+                    RoleSessionName=session_name
+                )
+                credentials = assumed_role['Credentials']
+                self._save_cached_credentials(role_arn, credentials)
 
             # Return new session with temporary credentials
             return boto3.Session(
-                aws_access_key_id=assumed_role['Credentials']['AccessKeyId'],
-                aws_secret_access_key=assumed_role['Credentials']['SecretAccessKey'],
-                aws_session_token=assumed_role['Credentials']['SessionToken'],
+                aws_access_key_id=credentials['AccessKeyId'],
+                aws_secret_access_key=credentials['SecretAccessKey'],
+                aws_session_token=credentials['SessionToken'],
                 region_name=self.region
             )
         except Exception as e:
             raise Exception(f"Failed to authenticate with AWS: {str(e)}")
 
+    def _load_cached_credentials(self, role_arn: str) -> Optional[Dict[str, Any]]:
+        """Return cached credentials for the role if they are still fresh.
+
+        Args:
+            role_arn: ARN of the role the credentials were issued for
+
+        Returns:
+            The cached STS credentials, or None if missing, unreadable or
+            expiring within STS_REFRESH_MARGIN
+        """
+        try:
+            credentials = _read_json(STS_CACHE_FILE)[role_arn]
+            expiration = datetime.fromisoformat(credentials['Expiration'])
+            for field in ('AccessKeyId', 'SecretAccessKey', 'SessionToken'):
+                if not isinstance(credentials[field], str):
+                    return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if expiration - STS_REFRESH_MARGIN <= datetime.now(timezone.utc):
+            return None
+        return credentials
+
+    def _save_cached_credentials(self, role_arn: str, credentials: Dict[str, Any]) -> None:
+        """Store STS credentials for the role, keeping other roles' entries.
+
+        Args:
+            role_arn: ARN of the role the credentials were issued for
+            credentials: Credentials dict returned by sts.assume_role
+        """
+        try:
+            cache = _read_json(STS_CACHE_FILE)
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+
+        cache[role_arn] = {
+            'AccessKeyId': credentials['AccessKeyId'],
+            'SecretAccessKey': credentials['SecretAccessKey'],
+            'SessionToken': credentials['SessionToken'],
+            'Expiration': credentials['Expiration'].isoformat()
+        }
+        try:
+            _write_json_atomic(STS_CACHE_FILE, cache)
+        except OSError:
+            # Caching is best effort; the credentials are still usable
+            pass
+
 class ECSCommandError(Exception):
     """Custom exception for ECS command errors."""
     pass
 
+class InstanceRow(NamedTuple):
+    """EC2 container instance as listed by ``ecsctl get ec2``.
+
+    Attributes:
+        instance_id: EC2 instance ID
+        instance_type: EC2 instance type
+        state: EC2 instance state name
+        status: ECS container instance status
+        running_tasks: Number of tasks running on the instance
+    """
+    instance_id: str
+    instance_type: str
+    state: str
+    status: str
+    running_tasks: int
+
+class ContainerRow(NamedTuple):
+    """Task container as listed by ``ecsctl get containers``.
+
+    Attributes:
+        name: Container name
+        status: Last known container status
+        task_id: ID of the task running the container
+        cpu: CPU units reserved for the container, or 'N/A'
+        memory: Hard memory limit in MiB, or 'N/A'
+        created: Task creation time, formatted in local time
+    """
+    name: str
+    status: str
+    task_id: str
+    cpu: str
+    memory: str
+    created: str
+
 class ClusterConfig:
     """Manages ECS cluster configuration."""
     
@@ -94,34 +411,84 @@ class ClusterConfig:
         """Initialize configuration management."""
         self.config_dir = CONFIG_DIR
         self.config_file = CONFIG_FILE
-        self._ensure_config_exists()
-
-    def _ensure_config_exists(self):
-        """Create config directory and file if they don't exist."""
-        self.config_dir.mkdir(exist_ok=True)
-        if not self.config_file.exists():
-            self._save_config({'current-cluster': None})
+        self._config = self._load_config()
 
     def _save_config(self, config: Dict[str, Any]):
-        """Save configuration to file."""
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        """Save configuration to file atomically."""
+        _write_json_atomic(self.config_file, config, pretty=True, fsync=True)
 
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file."""
-        with open(self.config_file, 'r') as f:
-            return json.load(f)
+        """Load configuration from file, creating it on first run.
+
+        Opens the file directly rather than checking for it first, so an
+        existing config costs a single open.
+        """
+        try:
+            return _read_json(self.config_file)
+        except FileNotFoundError:
+            config = {'current-cluster': None}
+            self._save_config(config)
+            return config
 
     def get_current_cluster(self) -> Optional[str]:
         """Get current cluster name."""
-        config = self._load_config()
-        return config.get('current-cluster')
+        return self._config.get('current-cluster')
 
     def set_current_cluster(self, cluster_name: str):
         """Set current cluster name."""
-        config = self._load_config()
-        config['current-cluster'] = cluster_name
-        self._save_config(config)
+        self._config['current-cluster'] = cluster_name
+        self._save_config(self._config)
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the lookup cache, treating a missing or corrupt file as empty.
+
+        Entries that are not ``{'value': ..., 'ts': <number>}`` are dropped,
+        so callers only ever see well-formed entries.
+        """
+        try:
+            cache = _read_json(CACHE_FILE)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {
+            key: entry for key, entry in cache.items()
+            if isinstance(entry, dict) and 'value' in entry
+            and isinstance(entry.get('ts'), (int, float))
+        }
+
+    def get_cached(self, key: str, ttl: float) -> Optional[Any]:
+        """Get a cached value if it was stored less than ``ttl`` seconds ago.
+
+        Args:
+            key: Cache entry name
+            ttl: Maximum age of the entry in seconds
+
+        Returns:
+            The cached value, or None if absent or expired
+        """
+        entry = self._load_cache().get(key)
+        if not entry or time.time() - entry['ts'] > ttl:
+            return None
+        return entry['value']
+
+    def set_cached(self, key: str, value: Any, ttl: float = CACHE_TTL):
+        """Store a JSON-serializable value in the cache with the current time.
+
+        Entries older than ``ttl`` are dropped on write, so the file doesn't
+        grow with every identity, region and cluster ever looked up.
+        """
+        now = time.time()
+        cache = {
+            cached_key: entry for cached_key, entry in self._load_cache().items()
+            if now - entry['ts'] <= ttl
+        }
+        cache[key] = {'value': value, 'ts': now}
+        try:
+            _write_json_atomic(CACHE_FILE, cache)
+        except OSError:
+            # Caching is best effort; the value was already fetched
+            pass
 
 class ECSController:
     """Controller for ECS operations.
@@ -150,110 +517,337 @@ class ECSController:
         Creates authenticated sessions and initializes service clients.
         Uses role assumption if AWS_ROLE_ARN is set.
         """
+        import boto3
+        from botocore.config import Config
+        from rich.console import Console
+
+        _use_orjson_for_botocore()
         self.aws_client = AWSClient()
-        role_arn = os.getenv('AWS_ROLE_ARN')
-        
+        self.role_arn = os.getenv('AWS_ROLE_ARN')
+
         session = (
-            self.aws_client.authenticate(role_arn) if role_arn
+            self.aws_client.authenticate(self.role_arn) if self.role_arn
             else boto3.Session(
                 profile_name=self.aws_client.profile_name,
                 region_name=self.aws_client.region
             )
         )
         
-        self.ecs_client = session.client('ecs')
-        self.ec2_client = session.client('ec2')
-        self.ssm_client = session.client('ssm')
+        # Adaptive retries back off on throttling from concurrent describe calls.
+        # Connection reuse comes from urllib3 pooling, sized here so every
+        # worker gets its own pooled connection; tcp_keepalive only enables
+        # SO_KEEPALIVE probes on idle sockets.
+        client_config = Config(
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True
+        )
+        self.ecs_client, self.ec2_client, self.ssm_client = _create_clients(
+            session, ['ecs', 'ec2', 'ssm'], client_config
+        )
+        self._cache_identity = self.role_arn or self.aws_client.profile_name
+        if not self._cache_identity:
+            # Without a role or profile, key on the access key so switching
+            # accounts via environment credentials never shares cache entries.
+            # The clients above already resolved the credentials.
+            credentials = session.get_credentials()
+            access_key = credentials.access_key if credentials else ''
+            self._cache_identity = hashlib.sha256(access_key.encode()).hexdigest()[:16]
         self.console = Console()
         self.config = ClusterConfig()
 
+    def cache_key(self, *parts: str) -> str:
+        """Build a lookup-cache key scoped to the current identity and region.
+
+        The role ARN, profile or a hash of the access key ID stands in for the
+        account so no extra STS call is needed to namespace the cache.
+        """
+        return ':'.join((self._cache_identity, self.aws_client.region) + parts)
+
     def get_clusters(self) -> List[str]:
         """Get list of all ECS clusters."""
         try:
-            clusters = self.ecs_client.list_clusters()['clusterArns']
+            paginator = self.ecs_client.get_paginator('list_clusters')
+            clusters = [
+                arn
+                for page in paginator.paginate(PaginationConfig={'PageSize': 100})
+                for arn in page['clusterArns']
+            ]
             return [cluster.split('/')[-1] for cluster in clusters]
         except Exception as e:
             raise ECSCommandError(f"Failed to get clusters: {str(e)}")
 
-    def get_ec2_instances(self, cluster_name: str) -> List[Dict[Any, Any]]:
-        """Get EC2 instances for specified cluster."""
+    def get_cluster_exists(self, cluster_name: str) -> bool:
+        """Check whether a cluster exists without listing every cluster.
+
+        describe_clusters looks the name up directly, so this costs one API
+        call however many clusters the account has. Deleted clusters can
+        still be described as INACTIVE, so only ACTIVE ones count. Callers
+        allowed ecs:ListClusters but not ecs:DescribeClusters fall back to
+        scanning the cluster list.
+        """
+        from botocore.exceptions import ClientError
+
         try:
-            container_instances = self.ecs_client.list_container_instances(
+            response = self.ecs_client.describe_clusters(clusters=[cluster_name])
+            return any(
+                cluster['clusterName'] == cluster_name
+                and cluster['status'] == 'ACTIVE'
+                for cluster in response['clusters']
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('AccessDenied', 'AccessDeniedException'):
+                return cluster_name in self.get_clusters()
+            raise ECSCommandError(f"Failed to check cluster: {str(e)}")
+        except Exception as e:
+            raise ECSCommandError(f"Failed to check cluster: {str(e)}")
+
+    def get_ec2_instances(self, cluster_name: str) -> Iterator[InstanceRow]:
+        """Get EC2 instances for specified cluster.
+
+        Instances are yielded batch by batch as their describe calls
+        complete, so callers can render them before the whole cluster is read.
+        """
+        try:
+            batches = self._list_batches(
+                'list_container_instances', 'containerInstanceArns',
                 cluster=cluster_name
-            )['containerInstanceArns']
-            
-            instances = []
-            if container_instances:
-                response = self.ecs_client.describe_container_instances(
-                    cluster=cluster_name,
-                    containerInstances=container_instances
-                )
-                
-                for instance in response['containerInstances']:
-                    ec2_response = self.ec2_client.describe_instances(
-                        InstanceIds=[instance['ec2InstanceId']]
-                    )
-                    
-                    instance_info = {
-                        'InstanceId': instance['ec2InstanceId'],
-                        'InstanceType': ec2_response['Reservations'][0]['Instances'][0]['InstanceType'],
-                        'State': ec2_response['Reservations'][0]['Instances'][0]['State']['Name'],
-                        'Status': instance['status'],
-                        'RunningTasks': instance['runningTasksCount']
-                    }
-                    instances.append(instance_info)
-            
-            return instances
+            )
+            for chunk_instances in _map_pipelined(
+                lambda chunk: self._describe_instance_chunk(cluster_name, chunk),
+                batches
+            ):
+                yield from chunk_instances
         except Exception as e:
             raise ECSCommandError(f"Failed to get EC2 instances: {str(e)}")
 
-    def get_containers(self, cluster_name: str) -> List[Dict[Any, Any]]:
-        """Get containers for specified cluster."""
+    def _describe_instance_chunk(
+        self, cluster_name: str, container_instances: List[str]
+    ) -> List[InstanceRow]:
+        """Describe one batch of container instances and their EC2 details."""
+        response = self.ecs_client.describe_container_instances(
+            cluster=cluster_name,
+            containerInstances=container_instances
+        )
+
+        # Resolve all EC2 instances in one call and join by instance ID
+        ec2_ids = [
+            instance['ec2InstanceId']
+            for instance in response['containerInstances']
+        ]
+        if not ec2_ids:
+            return []
+
+        ec2_response = self.ec2_client.describe_instances(InstanceIds=ec2_ids)
+        ec2_map = {
+            ec2_instance['InstanceId']: ec2_instance
+            for reservation in ec2_response['Reservations']
+            for ec2_instance in reservation['Instances']
+        }
+
+        instances = []
+        for instance in response['containerInstances']:
+            ec2_instance = ec2_map[instance['ec2InstanceId']]
+
+            instances.append(InstanceRow(
+                instance_id=instance['ec2InstanceId'],
+                instance_type=ec2_instance['InstanceType'],
+                state=ec2_instance['State']['Name'],
+                status=instance['status'],
+                running_tasks=instance['runningTasksCount']
+            ))
+
+        return instances
+
+    def get_containers(
+        self,
+        cluster_name: str,
+        desired_status: str = 'RUNNING',
+        family: Optional[str] = None
+    ) -> Iterator[ContainerRow]:
+        """Get containers for specified cluster.
+
+        Containers are yielded as each batch of tasks is described.
+
+        Args:
+            cluster_name: Cluster to list containers for
+            desired_status: Only include tasks with this desired status
+            family: Only include tasks from this task definition family
+        """
         try:
-            tasks = self.ecs_client.list_tasks(cluster=cluster_name)['taskArns']
-            containers = []
-            
-            if tasks:
-                response = self.ecs_client.describe_tasks(
-                    cluster=cluster_name,
-                    tasks=tasks
-                )
-                
-                for task in response['tasks']:
-                    for container in task['containers']:
-                        container_info = {
-                            'Name': container['name'],
-                            'Status': container['lastStatus'],
-                            'TaskId': task['taskArn'].split('/')[-1],
-                            'CPU': container.get('cpu', 'N/A'),
-                            'Memory': container.get('memory', 'N/A'),
-                            'Created': datetime.fromtimestamp(
-                                task['createdAt'].timestamp()
-                            ).strftime('%Y-%m-%d %H:%M:%S')
-                        }
-                        containers.append(container_info)
-            
-            return containers
+            # Narrow the task list server-side instead of filtering afterwards
+            list_kwargs = {'cluster': cluster_name, 'desiredStatus': desired_status}
+            if family:
+                list_kwargs['family'] = family
+
+            batches = self._list_batches('list_tasks', 'taskArns', **list_kwargs)
+            for task in self._iter_tasks(cluster_name, batches):
+                # Per-task fields are shared by all of the task's containers.
+                # botocore already returns createdAt as a local-time datetime.
+                task_id = task['taskArn'].split('/')[-1]
+                created = task['createdAt'].strftime('%Y-%m-%d %H:%M:%S')
+
+                for container in task['containers']:
+                    yield ContainerRow(
+                        name=container['name'],
+                        status=container['lastStatus'],
+                        task_id=task_id,
+                        cpu=container.get('cpu', 'N/A'),
+                        memory=container.get('memory', 'N/A'),
+                        created=created
+                    )
         except Exception as e:
             raise ECSCommandError(f"Failed to get containers: {str(e)}")
 
-    def get_instance_details(self, cluster_name: str, instance_id: str) -> Optional[Dict[str, Any]]:
-        """Get details for a specific EC2 instance in the cluster."""
+    def _iter_tasks(
+        self, cluster_name: str, batches: Iterable[List[str]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Describe batches of task ARNs concurrently, yielding each task in order.
+
+        Batches are consumed as they complete, so the full set of task
+        descriptions is never held in memory at once.
+        """
+        for chunk_tasks in _map_pipelined(
+            lambda chunk: self.ecs_client.describe_tasks(
+                cluster=cluster_name,
+                tasks=chunk
+            )['tasks'],
+            batches
+        ):
+            yield from chunk_tasks
+
+    def _list_batches(
+        self, operation: str, result_key: str, **kwargs: Any
+    ) -> Iterator[List[str]]:
+        """Paginate an ECS list_* call, yielding ARNs in describe-sized batches.
+
+        Each page is yielded as soon as it arrives so describe calls for it
+        can start while later pages are still being listed.
+        """
+        paginator = self.ecs_client.get_paginator(operation)
+        for page in paginator.paginate(**kwargs, PaginationConfig={'PageSize': 100}):
+            yield from _chunks(page[result_key], DESCRIBE_BATCH_SIZE)
+
+    def get_instance_details(self, cluster_name: str, instance_id: str) -> Optional[InstanceRow]:
+        """Get details for a specific EC2 instance in the cluster.
+
+        The instance ID is pushed down as a cluster query filter, so only the
+        matching container instance is listed and described rather than the
+        whole cluster.
+        """
+        # Only well-formed IDs are interpolated into the query expression
+        if not EC2_INSTANCE_ID_PATTERN.fullmatch(instance_id):
+            return None
+
         try:
-            instances = self.get_ec2_instances(cluster_name)
-            return next((instance for instance in instances if instance['InstanceId'] == instance_id), None)
+            container_instances = self.ecs_client.list_container_instances(
+                cluster=cluster_name,
+                filter=f'ec2InstanceId == {instance_id}'
+            )['containerInstanceArns']
+            if not container_instances:
+                return None
+
+            instances = self._describe_instance_chunk(cluster_name, container_instances)
+            return next((instance for instance in instances if instance.instance_id == instance_id), None)
         except Exception as e:
             raise ECSCommandError(f"Failed to get instance details: {str(e)}")
 
     def check_ssm_status(self, instance_id: str) -> bool:
-        """Check if SSM is available on the instance."""
+        """Check if SSM is available on the instance.
+
+        Filters on both the instance ID and an online ping status, so this is
+        a single call that returns at most one entry.
+
+        Raises:
+            ECSCommandError: If SSM instance information cannot be retrieved
+        """
         try:
             response = self.ssm_client.describe_instance_information(
-                Filters=[{'Key': 'InstanceIds', 'Values': [instance_id]}]
+                Filters=[
+                    {'Key': 'InstanceIds', 'Values': [instance_id]},
+                    {'Key': 'PingStatus', 'Values': ['Online']}
+                ]
             )
             return len(response['InstanceInformationList']) > 0
         except Exception as e:
-            return False
+            raise ECSCommandError(f"Failed to check SSM status: {str(e)}")
+
+    def start_session(self, instance_id: str) -> None:
+        """Open an interactive SSM shell on the instance.
+
+        Calls StartSession directly and hands the session to
+        session-manager-plugin, replacing the current process. This skips
+        starting the AWS CLI, which would load botocore all over again.
+
+        Raises:
+            ECSCommandError: If the plugin is not installed or the session
+                cannot be started
+        """
+        # ``aws ssm start-session`` drives the same plugin, so without it
+        # there is nothing to fall back to.
+        plugin = shutil.which('session-manager-plugin')
+        if plugin is None:
+            raise ECSCommandError(
+                "session-manager-plugin not found on PATH. Install the Session "
+                "Manager plugin: https://docs.aws.amazon.com/systems-manager/"
+                "latest/userguide/session-manager-working-with-install-plugin.html"
+            )
+
+        parameters = {'Target': instance_id}
+        try:
+            response = self.ssm_client.start_session(**parameters)
+        except Exception as e:
+            raise ECSCommandError(f"Failed to start session: {str(e)}")
+
+        # The response carries the session token, so hand it over through the
+        # environment rather than argv where other users could read it; the
+        # plugin reads the variable named in its first argument.
+        env = dict(os.environ)
+        env['AWS_SSM_START_SESSION_RESPONSE'] = json.dumps(response)
+        sys.stdout.flush()
+        os.execve(plugin, [
+            plugin,
+            'AWS_SSM_START_SESSION_RESPONSE',
+            self.aws_client.region,
+            'StartSession',
+            self.aws_client.profile_name or '',
+            json.dumps(parameters),
+            self.ssm_client.meta.endpoint_url
+        ], env)
+
+def _make_clusters_table() -> 'Table':
+    """Create the empty table rendered by ``get-clusters``."""
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Cluster Name")
+    table.add_column("Current")
+    return table
+
+def _make_instances_table() -> 'Table':
+    """Create the empty table rendered by ``get ec2``."""
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Instance ID")
+    table.add_column("Type")
+    table.add_column("State")
+    table.add_column("Status")
+    table.add_column("Running Tasks")
+    return table
+
+def _make_containers_table() -> 'Table':
+    """Create the empty table rendered by ``get containers``."""
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Name")
+    table.add_column("Status")
+    table.add_column("Task ID")
+    table.add_column("CPU")
+    table.add_column("Memory")
+    table.add_column("Created")
+    return table
 
 @click.group()
 def cli():
@@ -266,11 +860,23 @@ def use_cluster(cluster_name: str):
     """Select ECS cluster to use."""
     try:
         ecs = ECSController()
-        clusters = ecs.get_clusters()
-        
-        if cluster_name not in clusters:
+        cache_key = ecs.cache_key('clusters')
+        cluster_set = set(ecs.config.get_cached(cache_key, CACHE_TTL) or ())
+
+        cluster_found = cluster_name in cluster_set
+        if not cluster_found:
+            # Look the name up directly instead of listing every cluster
+            cluster_found = ecs.get_cluster_exists(cluster_name)
+            if cluster_found:
+                cluster_set.add(cluster_name)
+                ecs.config.set_cached(cache_key, sorted(cluster_set))
+
+        if not cluster_found:
+            # The full list is only needed to show the user what exists
+            cluster_set = set(ecs.get_clusters())
+            ecs.config.set_cached(cache_key, sorted(cluster_set))
             click.echo(f"Error: Cluster '{cluster_name}' not found. Available clusters:", err=True)
-            for cluster in clusters:
+            for cluster in sorted(cluster_set):
                 click.echo(f"  - {cluster}")
             sys.exit(1)
             
@@ -288,10 +894,7 @@ def get_clusters():
         clusters = ecs.get_clusters()
         current = ecs.config.get_current_cluster()
         
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Cluster Name")
-        table.add_column("Current")
-        
+        table = _make_clusters_table()
         for cluster in clusters:
             table.add_row(
                 cluster,
@@ -311,6 +914,8 @@ def get():
 @get.command('ec2')
 def get_ec2():
     """Get EC2 instances in current cluster."""
+    from rich.live import Live
+
     try:
         ecs = ECSController()
         current_cluster = ecs.config.get_current_cluster()
@@ -319,32 +924,35 @@ def get_ec2():
             click.echo("Error: No cluster selected. Use 'ecsctl use-cluster' first.", err=True)
             sys.exit(1)
             
-        instances = ecs.get_ec2_instances(current_cluster)
-        
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Instance ID")
-        table.add_column("Type")
-        table.add_column("State")
-        table.add_column("Status")
-        table.add_column("Running Tasks")
-        
-        for instance in instances:
-            table.add_row(
-                instance['InstanceId'],
-                instance['InstanceType'],
-                instance['State'],
-                instance['Status'],
-                str(instance['RunningTasks'])
-            )
-        
+        table = _make_instances_table()
+
+        # Render rows as each batch arrives instead of after the full scan.
+        # The live view is transient and the table is only printed once every
+        # row has loaded, so a failure part-way shows just the error.
+        with Live(table, console=ecs.console, refresh_per_second=4, transient=True):
+            for instance in ecs.get_ec2_instances(current_cluster):
+                table.add_row(
+                    instance.instance_id,
+                    instance.instance_type,
+                    instance.state,
+                    instance.status,
+                    str(instance.running_tasks)
+                )
+
         ecs.console.print(table)
     except ECSCommandError as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
 
 @get.command('containers')
-def get_containers():
+@click.option('--status', 'desired_status', default='RUNNING', show_default=True,
+              type=click.Choice(['RUNNING', 'PENDING', 'STOPPED'], case_sensitive=False),
+              help="Only show tasks with this desired status.")
+@click.option('--family', help="Only show tasks from this task definition family.")
+def get_containers(desired_status: str, family: Optional[str]):
     """Get containers in current cluster."""
+    from rich.live import Live
+
     try:
         ecs = ECSController()
         current_cluster = ecs.config.get_current_cluster()
@@ -353,26 +961,28 @@ def get_containers():
             click.echo("Error: No cluster selected. Use 'ecsctl use-cluster' first.", err=True)
             sys.exit(1)
             
-        containers = ecs.get_containers(current_cluster)
-        
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Name")
-        table.add_column("Status")
-        table.add_column("Task ID")
-        table.add_column("CPU")
-        table.add_column("Memory")
-        table.add_column("Created")
-        
-        for container in containers:
-            table.add_row(
-                container['Name'],
-                container['Status'],
-                container['TaskId'],
-                str(container['CPU']),
-                str(container['Memory']),
-                container['Created']
-            )
-        
+        containers = ecs.get_containers(
+            current_cluster,
+            desired_status=desired_status.upper(),
+            family=family
+        )
+
+        table = _make_containers_table()
+
+        # Render rows as each batch arrives instead of after the full scan.
+        # The live view is transient and the table is only printed once every
+        # row has loaded, so a failure part-way shows just the error.
+        with Live(table, console=ecs.console, refresh_per_second=4, transient=True):
+            for container in containers:
+                table.add_row(
+                    container.name,
+                    container.status,
+                    container.task_id,
+                    str(container.cpu),
+                    str(container.memory),
+                    container.created
+                )
+
         ecs.console.print(table)
     except ECSCommandError as e:
         click.echo(f"Error: {str(e)}", err=True)
@@ -391,28 +1001,22 @@ def exec_instance(instance_id: str):
             sys.exit(1)
 
         # Verify instance exists in cluster
-        instance = ecs.get_instance_details(current_cluster, instance_id)
-        if not instance:
-            click.echo(f"Error: Instance '{instance_id}' not found in cluster '{current_cluster}'", err=True)
-            sys.exit(1)
+        cache_key = ecs.cache_key('instances', current_cluster)
+        instance_ids = set(ecs.config.get_cached(cache_key, CACHE_TTL) or ())
+        if instance_id not in instance_ids:
+            if not ecs.get_instance_details(current_cluster, instance_id):
+                click.echo(f"Error: Instance '{instance_id}' not found in cluster '{current_cluster}'", err=True)
+                sys.exit(1)
+            instance_ids.add(instance_id)
+            ecs.config.set_cached(cache_key, sorted(instance_ids))
 
         # Check SSM availability
         if not ecs.check_ssm_status(instance_id):
             click.echo(f"Error: SSM is not available on instance '{instance_id}'", err=True)
             sys.exit(1)
 
-        # Start SSM session with profile and region
         click.echo(f"Starting session with instance '{instance_id}'...")
-        cmd = ['aws', 'ssm', 'start-session', '--target', instance_id]
-        
-        # Add profile if available
-        if ecs.aws_client.profile_name:
-            cmd.extend(['--profile', ecs.aws_client.profile_name])
-        
-        # Add region
-        cmd.extend(['--region', ecs.aws_client.region])
-        
-        subprocess.run(cmd)
+        ecs.start_session(instance_id)
 
     except ECSCommandError as e:
         click.echo(f"Error: {str(e)}", err=True)
@@ -0,0 +1,343 @@
+"""Unit tests for the ecsctl caching and batching helpers.
+
+Run from the ``python`` directory with ``python -m unittest discover tests``.
+Every test runs against a temporary HOME so no real ~/.ecsctl or ~/.aws
+state is read or written, and AWS calls are served by botocore's Stubber.
+"""
+
+import os
+import pickle
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+import boto3
+import botocore
+from botocore.config import Config
+from botocore.loaders import Loader
+from botocore.stub import Stubber
+
+import ecsctl
+
+ROLE_ARN = 'arn:aws:iam::123456789012:role/Test'
+
+
+class TempHomeTestCase(unittest.TestCase):
+    """Point HOME and the ecsctl file locations at a fresh temporary dir."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.home = Path(tmp.name)
+        config_dir = self.home / '.ecsctl'
+
+        env = {
+            'HOME': str(self.home),
+            'AWS_REGION': 'us-east-1',
+            'AWS_ACCESS_KEY_ID': 'testing',
+            'AWS_SECRET_ACCESS_KEY': 'testing',
+        }
+        patches = [
+            mock.patch.dict(os.environ, env),
+            mock.patch.object(ecsctl, 'CONFIG_DIR', config_dir),
+            mock.patch.object(ecsctl, 'CONFIG_FILE', config_dir / 'config.json'),
+            mock.patch.object(ecsctl, 'STS_CACHE_FILE', config_dir / 'sts-cache.json'),
+            mock.patch.object(ecsctl, 'CACHE_FILE', config_dir / 'cache.json'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        for name in ('AWS_PROFILE', 'AWS_DATA_PATH'):
+            os.environ.pop(name, None)
+
+
+class MapPipelinedTest(unittest.TestCase):
+
+    def test_results_keep_input_order(self):
+        # Earlier batches sleep longer, so they finish last
+        def work(batch):
+            time.sleep(0.01 * (5 - batch))
+            return batch * 10
+
+        self.assertEqual(
+            list(ecsctl._map_pipelined(work, range(5))), [0, 10, 20, 30, 40]
+        )
+
+    def test_batches_are_submitted_before_input_is_exhausted(self):
+        started = threading.Event()
+
+        def batches():
+            yield 1
+            # The first batch must already be running while we produce more
+            self.assertTrue(started.wait(timeout=5))
+            yield 2
+
+        def work(batch):
+            started.set()
+            return batch
+
+        self.assertEqual(list(ecsctl._map_pipelined(work, batches())), [1, 2])
+
+    def test_error_in_batch_propagates(self):
+        def work(batch):
+            if batch == 2:
+                raise ValueError('boom')
+            return batch
+
+        results = ecsctl._map_pipelined(work, [1, 2, 3])
+        self.assertEqual(next(results), 1)
+        with self.assertRaisesRegex(ValueError, 'boom'):
+            list(results)
+
+    def test_error_in_input_propagates(self):
+        def batches():
+            yield 1
+            raise RuntimeError('list failed')
+
+        with self.assertRaisesRegex(RuntimeError, 'list failed'):
+            list(ecsctl._map_pipelined(lambda batch: batch, batches()))
+
+
+class StsCacheTest(TempHomeTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.sts = boto3.client('sts', region_name='us-east-1')
+        self.stubber = Stubber(self.sts)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+        patch = mock.patch.object(boto3.Session, 'client', return_value=self.sts)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.client = ecsctl.AWSClient()
+
+    def credentials(self, key_id, expires_in):
+        return {
+            'AccessKeyId': key_id,
+            'SecretAccessKey': 'secret-' + key_id,
+            'SessionToken': 'token-' + key_id,
+            'Expiration': datetime.now(timezone.utc) + expires_in,
+        }
+
+    def expect_assume_role(self, credentials):
+        self.stubber.add_response(
+            'assume_role',
+            {'Credentials': credentials},
+            {'RoleArn': ROLE_ARN, 'RoleSessionName': 'AssumeRoleSession'},
+        )
+
+    def access_key(self, session):
+        return session.get_credentials().access_key
+
+    def test_assumes_role_and_caches_credentials(self):
+        self.expect_assume_role(self.credentials('AKIAFIRST0000000', timedelta(hours=1)))
+
+        session = self.client.authenticate(ROLE_ARN)
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(self.access_key(session), 'AKIAFIRST0000000')
+        cached = ecsctl._read_json(ecsctl.STS_CACHE_FILE)
+        self.assertEqual(cached[ROLE_ARN]['AccessKeyId'], 'AKIAFIRST0000000')
+
+    def test_reuses_credentials_outside_refresh_margin(self):
+        self.client._save_cached_credentials(
+            ROLE_ARN,
+            self.credentials(
+                'AKIACACHED000000', ecsctl.STS_REFRESH_MARGIN + timedelta(minutes=1)
+            ),
+        )
+
+        # No stubbed responses: any STS call would fail the test
+        session = self.client.authenticate(ROLE_ARN)
+
+        self.assertEqual(self.access_key(session), 'AKIACACHED000000')
+
+    def test_refreshes_credentials_within_refresh_margin(self):
+        self.client._save_cached_credentials(
+            ROLE_ARN,
+            self.credentials(
+                'AKIASTALE0000000', ecsctl.STS_REFRESH_MARGIN - timedelta(minutes=1)
+            ),
+        )
+        self.expect_assume_role(self.credentials('AKIAFRESH0000000', timedelta(hours=1)))
+
+        session = self.client.authenticate(ROLE_ARN)
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(self.access_key(session), 'AKIAFRESH0000000')
+        cached = ecsctl._read_json(ecsctl.STS_CACHE_FILE)
+        self.assertEqual(cached[ROLE_ARN]['AccessKeyId'], 'AKIAFRESH0000000')
+
+    def test_malformed_cache_is_replaced(self):
+        ecsctl.CONFIG_DIR.mkdir()
+        ecsctl.STS_CACHE_FILE.write_text('[]')
+        self.expect_assume_role(self.credentials('AKIAFIRST0000000', timedelta(hours=1)))
+
+        self.client.authenticate(ROLE_ARN)
+
+        cached = ecsctl._read_json(ecsctl.STS_CACHE_FILE)
+        self.assertEqual(list(cached), [ROLE_ARN])
+
+
+class LookupCacheTest(TempHomeTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.config = ecsctl.ClusterConfig()
+
+    def test_entry_is_returned_within_ttl(self):
+        with mock.patch('time.time', return_value=1000.0):
+            self.config.set_cached('clusters', ['a', 'b'])
+        with mock.patch('time.time', return_value=1000.0 + ecsctl.CACHE_TTL):
+            self.assertEqual(
+                self.config.get_cached('clusters', ecsctl.CACHE_TTL), ['a', 'b']
+            )
+
+    def test_entry_expires_after_ttl(self):
+        with mock.patch('time.time', return_value=1000.0):
+            self.config.set_cached('clusters', ['a', 'b'])
+        with mock.patch('time.time', return_value=1000.0 + ecsctl.CACHE_TTL + 1):
+            self.assertIsNone(self.config.get_cached('clusters', ecsctl.CACHE_TTL))
+
+    def test_missing_key_returns_none(self):
+        self.assertIsNone(self.config.get_cached('clusters', ecsctl.CACHE_TTL))
+
+    def test_expired_entries_are_pruned_on_write(self):
+        with mock.patch('time.time', return_value=1000.0):
+            self.config.set_cached('old', 1)
+        with mock.patch('time.time', return_value=1000.0 + ecsctl.CACHE_TTL + 1):
+            self.config.set_cached('new', 2)
+
+        self.assertEqual(list(ecsctl._read_json(ecsctl.CACHE_FILE)), ['new'])
+
+    def test_malformed_cache_is_ignored(self):
+        ecsctl.CACHE_FILE.write_text('{"clusters": ["not", "an", "entry"]}')
+
+        self.assertIsNone(self.config.get_cached('clusters', ecsctl.CACHE_TTL))
+
+
+class ModelCacheTest(TempHomeTestCase):
+
+    def setUp(self):
+        super().setUp()
+        ecsctl.CONFIG_DIR.mkdir()
+        self.cache_file = ecsctl.CONFIG_DIR / f'models-{botocore.__version__}.pkl'
+
+    def create_clients(self):
+        """Create ecs/ssm clients, returning them and the models loaded from disk."""
+        loaded = []
+        load_service_model = Loader.load_service_model
+
+        def spy(loader, service_name, type_name, api_version=None):
+            loaded.append((service_name, type_name))
+            return load_service_model(loader, service_name, type_name, api_version)
+
+        with mock.patch.object(Loader, 'load_service_model', spy):
+            session = boto3.Session(region_name='us-east-1')
+            clients = ecsctl._create_clients(session, ['ecs', 'ssm'], Config())
+        return clients, loaded
+
+    def test_miss_loads_models_and_writes_cache(self):
+        (stale_file := ecsctl.CONFIG_DIR / 'models-0.0.0.pkl').write_bytes(b'')
+
+        clients, loaded = self.create_clients()
+
+        self.assertIn(('ecs', 'service-2'), loaded)
+        self.assertIn(('ssm', 'paginators-1'), loaded)
+        with open(self.cache_file, 'rb') as f:
+            models = pickle.load(f)
+        self.assertEqual(
+            {(service, type_name) for service, type_name, _ in models}, set(loaded)
+        )
+        self.assertFalse(stale_file.exists())
+        self.assertEqual(
+            [client.meta.service_model.service_name for client in clients],
+            ['ecs', 'ssm'],
+        )
+
+    def test_hit_loads_nothing_from_disk(self):
+        self.create_clients()
+        mtime = self.cache_file.stat().st_mtime_ns
+
+        (ecs, ssm), loaded = self.create_clients()
+
+        self.assertEqual(loaded, [])
+        self.assertEqual(self.cache_file.stat().st_mtime_ns, mtime)
+        # Paginators are served from the cache as well
+        ecs.get_paginator('list_clusters')
+        ssm.get_paginator('describe_instance_information')
+        self.assertEqual(loaded, [])
+
+    def test_corrupt_cache_is_treated_as_miss(self):
+        self.cache_file.write_bytes(b'not a pickle')
+
+        _, loaded = self.create_clients()
+
+        self.assertIn(('ecs', 'service-2'), loaded)
+        with open(self.cache_file, 'rb') as f:
+            self.assertIsInstance(pickle.load(f), dict)
+
+    def test_custom_data_path_bypasses_cache(self):
+        data_path = self.home / 'models'
+        data_path.mkdir()
+        os.environ['AWS_DATA_PATH'] = str(data_path)
+
+        _, loaded = self.create_clients()
+
+        self.assertIn(('ecs', 'service-2'), loaded)
+        self.assertFalse(self.cache_file.exists())
+
+
+class ClusterExistsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.ecs = ecsctl.ECSController.__new__(ecsctl.ECSController)
+        self.ecs.ecs_client = boto3.client(
+            'ecs', region_name='us-east-1',
+            aws_access_key_id='testing', aws_secret_access_key='testing',
+        )
+        self.stubber = Stubber(self.ecs.ecs_client)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+
+    def expect_describe(self, status):
+        self.stubber.add_response(
+            'describe_clusters',
+            {'clusters': [{'clusterName': 'prod', 'status': status}]},
+            {'clusters': ['prod']},
+        )
+
+    def test_active_cluster_exists(self):
+        self.expect_describe('ACTIVE')
+
+        self.assertTrue(self.ecs.get_cluster_exists('prod'))
+
+    def test_inactive_cluster_does_not_exist(self):
+        self.expect_describe('INACTIVE')
+
+        self.assertFalse(self.ecs.get_cluster_exists('prod'))
+
+    def test_access_denied_falls_back_to_listing(self):
+        self.stubber.add_client_error('describe_clusters', 'AccessDeniedException')
+        self.stubber.add_response(
+            'list_clusters',
+            {'clusterArns': ['arn:aws:ecs:us-east-1:123456789012:cluster/prod']},
+            {'maxResults': 100},
+        )
+
+        self.assertTrue(self.ecs.get_cluster_exists('prod'))
+        self.stubber.assert_no_pending_responses()
+
+    def test_other_errors_are_reported(self):
+        self.stubber.add_client_error('describe_clusters', 'ClusterNotFoundException')
+
+        with self.assertRaisesRegex(ecsctl.ECSCommandError, 'Failed to check cluster'):
+            self.ecs.get_cluster_exists('prod')
+
+
+if __name__ == '__main__':
+    unittest.main()